@@ -55,14 +55,14 @@ echo.
 :: Install required packages
 echo Installing required Python packages...
 echo ----------------------------------------
-pip install pyinstaller pillow pyqt5 pyyaml keyboard
+pip install pyinstaller pillow pyqt5 pyyaml
 pip install git+https://github.com/chvolkmann/voicemeeter-remote-python.git
 
 if errorlevel 1 (
     echo.
     echo ERROR: Failed to install required packages
     echo Try running these commands manually:
-    echo   pip install --user pyinstaller pillow pyqt5 pyyaml keyboard
+    echo   pip install --user pyinstaller pillow pyqt5 pyyaml
     echo   pip install --user git+https://github.com/chvolkmann/voicemeeter-remote-python.git
     pause
     exit /b 1
@@ -3,12 +3,17 @@ Voicemeeter Control Installation Builder Script
 Creates a Windows installer using PyInstaller and Inno Setup
 """
 
+import concurrent.futures
+import hashlib
+import importlib.metadata
 import os
 import sys
 import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from string import Template
 
 # Configuration
 APP_NAME = "Voicemeeter Control"
@@ -17,101 +22,60 @@ APP_PUBLISHER = "Daniel Rasmussen"
 APP_URL = "https://github.com/danielgrasmussen/voicemeeter-control"
 APP_GUID = "{4285c7a1-b182-47b7-bfed-1fd7e7096f83}"
 
-class InstallerBuilder:
-    def __init__(self):
-        # Determine safe working directory
-        self.setup_working_directory()
-        
-    def setup_working_directory(self):
-        """Setup a safe working directory for builds"""
-        # Check if we're in Program Files (protected directory)
-        current_dir = Path.cwd()
-        program_files_paths = [
-            Path(os.environ.get('PROGRAMFILES', 'C:\\Program Files')),
-            Path(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')),
-            Path(os.environ.get('PROGRAMW6432', 'C:\\Program Files'))
-        ]
-        
-        in_protected_dir = any(
-            str(current_dir).startswith(str(pf)) 
-            for pf in program_files_paths 
-            if pf.exists()
-        )
-        
-        if in_protected_dir:
-            # Use temp directory for builds
-            print("⚠️  Detected protected directory, using temp folder for build...")
-            self.root_dir = Path(tempfile.gettempdir()) / "VoicemeeterControl_Build"
-            self.root_dir.mkdir(exist_ok=True)
-            
-            # Copy source files to temp directory
-            print(f"📁 Working directory: {self.root_dir}")
-            source_files = [
-                'voicemeeter_control.py',
-                'volume_display.py',
-                'hotkey_handler.py',
-                'config.yaml',
-                'icon.png',
-                'LICENSE',
-                'README.md'
-            ]
-            
-            for file in source_files:
-                src = current_dir / file
-                if src.exists():
-                    shutil.copy2(src, self.root_dir / file)
-                    print(f"  ✓ Copied {file}")
-        else:
-            # Use current directory
-            self.root_dir = current_dir
-            
-        # Create build folders
-        self.build_folder = self.root_dir / "build_output"
-        self.build_folder.mkdir(exist_ok=True)
-        
-        # Setup subdirectories
-        self.dist_dir = self.build_folder / "dist"
-        self.build_dir = self.build_folder / "build"
-        self.installer_dir = self.build_folder / "installer"
-        self.temp_dir = self.build_folder / "temp"
-        
-        # Create all directories
-        for directory in [self.dist_dir, self.build_dir, self.installer_dir, self.temp_dir]:
-            directory.mkdir(exist_ok=True)
-            
-        print(f"\n📂 Build output folder: {self.build_folder}")
-        
-    def clean_build_dirs(self):
-        """Clean previous build artifacts"""
-        print("\n🧹 Cleaning build directories...")
-        for dir_path in [self.dist_dir, self.build_dir, self.temp_dir]:
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
-                dir_path.mkdir(exist_ok=True)
-        
-    def create_spec_file(self):
-        """Create PyInstaller spec file"""
-        print("\n📝 Creating PyInstaller spec file...")
-        
-        # Convert paths to use forward slashes to avoid escape sequence issues
-        root_dir_str = str(self.root_dir).replace('\\', '/')
-        temp_dir_str = str(self.temp_dir).replace('\\', '/')
-        build_folder_str = str(self.build_folder).replace('\\', '/')
-        
-        spec_content = f'''
+# UPX compression is slow and only worth it for release builds (set RELEASE=1)
+RELEASE_BUILD = os.environ.get('RELEASE') == '1'
+
+# Large DLLs that UPX should never compress (they'd pay a decompression cost on every launch)
+UPX_EXCLUDE = [
+    'vcruntime140.dll',
+    f'python{sys.version_info.major}{sys.version_info.minor}.dll',
+    'Qt5Core.dll',
+    'Qt5Gui.dll',
+    'Qt5Widgets.dll'
+]
+
+# Files bundled into the executable; a change to any of them requires a rebuild
+BUILD_INPUTS = [
+    'voicemeeter_control.py',
+    'volume_display.py',
+    'hotkey_handler.py',
+    'config.yaml',
+    'icon.png',
+    'README.md',
+    'LICENSE'
+]
+
+# Distributions whose code ends up in (or builds) the executable; upgrading any of them
+# requires a rebuild. Pillow only affects whether icon.ico can be generated.
+BUNDLED_DISTRIBUTIONS = [
+    'pyinstaller',
+    'pyinstaller-hooks-contrib',
+    'PyQt5',
+    'PyQt5-Qt5',
+    'PyQt5-sip',
+    'PyYAML',
+    'voicemeeter',
+    'Pillow'
+]
+
+# Icon sizes embedded in icon.ico, largest first
+ICON_SIZES = [(256, 256), (48, 48), (32, 32), (16, 16)]
+
+# Generated file templates ($name placeholders are filled in by InstallerBuilder)
+SPEC_TEMPLATE = Template('''
 # -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
 a = Analysis(
-    ['{root_dir_str}/voicemeeter_control.py'],
-    pathex=['{root_dir_str}'],
+    ['$root_dir/voicemeeter_control.py'],
+    pathex=['$root_dir'],
     binaries=[],
     datas=[
-        ('{root_dir_str}/config.yaml', '.'),
-        ('{root_dir_str}/icon.png', '.'),
-        ('{root_dir_str}/README.md', '.'),
-        ('{root_dir_str}/LICENSE', '.'),
+        ('$root_dir/config.yaml', '.'),
+        ('$root_dir/icon.png', '.'),
+        ('$root_dir/README.md', '.'),
+        ('$root_dir/LICENSE', '.'),
     ],
     hiddenimports=[
         'PyQt5.QtCore',
@@ -120,10 +84,9 @@ a = Analysis(
         'yaml',
         'voicemeeter',
         'voicemeeter.remote',
-        'keyboard',
     ],
     hookspath=[],
-    hooksconfig={{}},
+    hooksconfig={},
     runtime_hooks=[],
     excludes=[],
     win_no_prefer_redirects=False,
@@ -141,35 +104,25 @@ exe = EXE(
     a.zipfiles,
     a.datas,
     [],
-    name='{APP_NAME.replace(" ", "")}',
+    name='$exe_name',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
+    upx=$upx,
+    upx_exclude=$upx_exclude,
     runtime_tmpdir=None,
     console=False,  # No console window
     disable_windowed_traceback=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    version='{temp_dir_str}/version_info.txt',
-    icon='{build_folder_str}/icon.ico',
+    version='$temp_dir/version_info.txt',
+    icon='$build_folder/icon.ico',
     uac_admin=False,
 )
-'''
-        
-        spec_file = self.temp_dir / 'voicemeeter_control.spec'
-        with open(spec_file, 'w') as f:
-            f.write(spec_content)
-        print(f"  ✓ Created: {spec_file}")
-        return spec_file
-    
-    def create_version_info(self):
-        """Create version info file for Windows executable"""
-        print("\n📋 Creating version info...")
-        
-        version_info = f'''
+''')
+
+VERSION_INFO_TEMPLATE = Template('''
 VSVersionInfo(
   ffi=FixedFileInfo(
     filevers=(1, 0, 0, 0),
@@ -186,95 +139,42 @@ VSVersionInfo(
       [
       StringTable(
         u'040904B0',
-        [StringStruct(u'CompanyName', u'{APP_PUBLISHER}'),
+        [StringStruct(u'CompanyName', u'$app_publisher'),
         StringStruct(u'FileDescription', u'Voicemeeter Control - Global hotkeys for Voicemeeter'),
-        StringStruct(u'FileVersion', u'{APP_VERSION}'),
-        StringStruct(u'InternalName', u'{APP_NAME}'),
-        StringStruct(u'LegalCopyright', u'Copyright (c) 2025 {APP_PUBLISHER}'),
-        StringStruct(u'OriginalFilename', u'{APP_NAME.replace(" ", "")}.exe'),
-        StringStruct(u'ProductName', u'{APP_NAME}'),
-        StringStruct(u'ProductVersion', u'{APP_VERSION}')])
+        StringStruct(u'FileVersion', u'$app_version'),
+        StringStruct(u'InternalName', u'$app_name'),
+        StringStruct(u'LegalCopyright', u'Copyright (c) 2025 $app_publisher'),
+        StringStruct(u'OriginalFilename', u'$exe_name.exe'),
+        StringStruct(u'ProductName', u'$app_name'),
+        StringStruct(u'ProductVersion', u'$app_version')])
       ]), 
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )
-'''
-        
-        version_file = self.temp_dir / 'version_info.txt'
-        with open(version_file, 'w') as f:
-            f.write(version_info)
-        print(f"  ✓ Created: {version_file}")
-    
-    def build_exe(self, spec_file):
-        """Build executable with PyInstaller"""
-        print("\n🔨 Building executable with PyInstaller...")
-        
-        # Change to root directory for build
-        original_dir = os.getcwd()
-        os.chdir(self.root_dir)
-        
-        try:
-            # First ensure PyInstaller is installed
-            subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], 
-                         capture_output=True, check=True)
-            
-            # Build the executable with custom paths
-            result = subprocess.run([
-                "pyinstaller",
-                "--clean",
-                "--distpath", str(self.dist_dir),
-                "--workpath", str(self.build_dir),
-                str(spec_file)
-            ], capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                print(f"❌ Build failed:\n{result.stderr}")
-                raise Exception("PyInstaller build failed")
-            else:
-                print("  ✓ Executable built successfully")
-                
-                # Copy icon.png to dist folder for the installer
-                icon_src = self.root_dir / "icon.png"
-                icon_dst = self.dist_dir / "icon.png"
-                if icon_src.exists():
-                    shutil.copy2(icon_src, icon_dst)
-                    print("  ✓ Copied icon.png to dist folder")
-                
-        finally:
-            os.chdir(original_dir)
-    
-    def create_inno_setup_script(self):
-        """Create Inno Setup script for installer"""
-        print("\n📦 Creating Inno Setup script...")
-        
-        # Convert paths for Inno Setup (uses Windows paths but doesn't have escape issues)
-        root_dir_str = str(self.root_dir)
-        dist_dir_str = str(self.dist_dir)
-        build_folder_str = str(self.build_folder)
-        exe_name = APP_NAME.replace(" ", "")
-        
-        inno_script = f'''
-#define MyAppName "{APP_NAME}"
-#define MyAppVersion "{APP_VERSION}"
-#define MyAppPublisher "{APP_PUBLISHER}"
-#define MyAppURL "{APP_URL}"
-#define MyAppExeName "{exe_name}.exe"
+''')
+
+INNO_SETUP_TEMPLATE = Template('''
+#define MyAppName "$app_name"
+#define MyAppVersion "$app_version"
+#define MyAppPublisher "$app_publisher"
+#define MyAppURL "$app_url"
+#define MyAppExeName "$exe_name.exe"
 
 [Setup]
-AppId={{{APP_GUID}}}
-AppName={{#MyAppName}}
-AppVersion={{#MyAppVersion}}
-AppPublisher={{#MyAppPublisher}}
-AppPublisherURL={{#MyAppURL}}
-AppSupportURL={{#MyAppURL}}
-AppUpdatesURL={{#MyAppURL}}
-DefaultDirName={{localappdata}}\\{{#MyAppName}}
+AppId={$app_guid}
+AppName={#MyAppName}
+AppVersion={#MyAppVersion}
+AppPublisher={#MyAppPublisher}
+AppPublisherURL={#MyAppURL}
+AppSupportURL={#MyAppURL}
+AppUpdatesURL={#MyAppURL}
+DefaultDirName={localappdata}\\{#MyAppName}
 DisableProgramGroupPage=yes
-LicenseFile={root_dir_str}\\LICENSE
-OutputDir={build_folder_str}\\installer_output
-OutputBaseFilename=VoicemeeterControl_Setup_v{{#MyAppVersion}}
-SetupIconFile={build_folder_str}\\icon.ico
-UninstallDisplayIcon={{app}}\\{{#MyAppExeName}}
+LicenseFile=$root_dir\\LICENSE
+OutputDir=$build_folder\\installer_output
+OutputBaseFilename=VoicemeeterControl_Setup_v{#MyAppVersion}
+SetupIconFile=$build_folder\\icon.ico
+UninstallDisplayIcon={app}\\{#MyAppExeName}
 Compression=lzma
 SolidCompression=yes
 WizardStyle=modern
@@ -286,26 +186,27 @@ ArchitecturesInstallIn64BitMode=x64
 Name: "english"; MessagesFile: "compiler:Default.isl"
 
 [Tasks]
-Name: "desktopicon"; Description: "{{cm:CreateDesktopIcon}}"; GroupDescription: "{{cm:AdditionalIcons}}"; Flags: unchecked
-Name: "quicklaunchicon"; Description: "{{cm:CreateQuickLaunchIcon}}"; GroupDescription: "{{cm:AdditionalIcons}}"; Flags: unchecked; OnlyBelowVersion: 6.1
+Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked
+Name: "quicklaunchicon"; Description: "{cm:CreateQuickLaunchIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked; OnlyBelowVersion: 6.1
 
 [Files]
-Source: "{dist_dir_str}\\{{#MyAppExeName}}"; DestDir: "{{app}}"; Flags: ignoreversion
-Source: "{dist_dir_str}\\icon.png"; DestDir: "{{app}}"; Flags: ignoreversion
-Source: "{dist_dir_str}\\*"; DestDir: "{{app}}"; Flags: ignoreversion recursesubdirs createallsubdirs
-Source: "{root_dir_str}\\config.yaml"; DestDir: "{{app}}"; Flags: onlyifdoesntexist
+Source: "$dist_dir\\{#MyAppExeName}"; DestDir: "{app}"; Flags: ignoreversion
+Source: "$dist_dir\\icon.png"; DestDir: "{app}"; Flags: ignoreversion
+Source: "$dist_dir\\*"; DestDir: "{app}"; Flags: ignoreversion recursesubdirs createallsubdirs
+Source: "$root_dir\\config.yaml"; DestDir: "{app}"; Flags: onlyifdoesntexist
 
 [Icons]
-Name: "{{autoprograms}}\\{{#MyAppName}}"; Filename: "{{app}}\\{{#MyAppExeName}}"
-Name: "{{autodesktop}}\\{{#MyAppName}}"; Filename: "{{app}}\\{{#MyAppExeName}}"; Tasks: desktopicon
-Name: "{{userappdata}}\\Microsoft\\Internet Explorer\\Quick Launch\\{{#MyAppName}}"; Filename: "{{app}}\\{{#MyAppExeName}}"; Tasks: quicklaunchicon
+Name: "{autoprograms}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"
+Name: "{autodesktop}\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"; Tasks: desktopicon
+Name: "{userappdata}\\Microsoft\\Internet Explorer\\Quick Launch\\{#MyAppName}"; Filename: "{app}\\{#MyAppExeName}"; Tasks: quicklaunchicon
 
 [Run]
-Filename: "{{app}}\\{{#MyAppExeName}}"; Description: "{{cm:LaunchProgram,{{#StringChange(MyAppName, '&', '&&')}}}}"; Flags: nowait postinstall skipifsilent
+Filename: "{app}\\{#MyAppExeName}"; Description: "{cm:LaunchProgram,{#StringChange(MyAppName, '&', '&&')}}"; Flags: nowait postinstall skipifsilent
 
 [UninstallDelete]
-Type: files; Name: "{{app}}\\config.yaml"
-Type: files; Name: "{{app}}\\*.log"
+Type: files; Name: "{app}\\config.yaml"
+Type: files; Name: "{app}\\config.yaml.cache.json"
+Type: files; Name: "{app}\\*.log"
 
 [Code]
 function InitializeSetup(): Boolean;
@@ -315,12 +216,12 @@ begin
   Result := True;
   
   // Check if Voicemeeter is installed by looking for common installation paths
-  if not FileExists(ExpandConstant('{{pf}}\\VB\\Voicemeeter\\voicemeeter.exe')) and
-     not FileExists(ExpandConstant('{{pf64}}\\VB\\Voicemeeter\\voicemeeter.exe')) and
-     not FileExists(ExpandConstant('{{pf}}\\VB\\Voicemeeter Banana\\VoicemeeterBanana.exe')) and
-     not FileExists(ExpandConstant('{{pf64}}\\VB\\Voicemeeter Banana\\VoicemeeterBanana.exe')) and
-     not FileExists(ExpandConstant('{{pf}}\\VB\\Voicemeeter Potato\\VoicemeeterPotato.exe')) and
-     not FileExists(ExpandConstant('{{pf64}}\\VB\\Voicemeeter Potato\\VoicemeeterPotato.exe')) then
+  if not FileExists(ExpandConstant('{pf}\\VB\\Voicemeeter\\voicemeeter.exe')) and
+     not FileExists(ExpandConstant('{pf64}\\VB\\Voicemeeter\\voicemeeter.exe')) and
+     not FileExists(ExpandConstant('{pf}\\VB\\Voicemeeter Banana\\VoicemeeterBanana.exe')) and
+     not FileExists(ExpandConstant('{pf64}\\VB\\Voicemeeter Banana\\VoicemeeterBanana.exe')) and
+     not FileExists(ExpandConstant('{pf}\\VB\\Voicemeeter Potato\\VoicemeeterPotato.exe')) and
+     not FileExists(ExpandConstant('{pf64}\\VB\\Voicemeeter Potato\\VoicemeeterPotato.exe')) then
   begin
     Message := 'Voicemeeter does not appear to be installed on this system.' + #13#10 + #13#10 +
                'This application requires Voicemeeter (Basic, Banana, or Potato) to function properly.' + #13#10 + #13#10 +
@@ -338,10 +239,285 @@ begin
     // Any post-installation tasks
   end;
 end;
-'''
+''')
+
+class InstallerBuilder:
+    def __init__(self):
+        # Per-thread output buffer for build steps run on worker threads (see run_buffered)
+        self._output = threading.local()
+        # Determine safe working directory
+        self.setup_working_directory()
+    
+    def log(self, *args):
+        """Print a line, or buffer it when called from a step running under run_buffered"""
+        lines = getattr(self._output, 'lines', None)
+        if lines is None:
+            print(*args)
+        else:
+            lines.append(" ".join(map(str, args)))
+    
+    def run_buffered(self, step):
+        """Run a build step, returning its result and the lines it logged instead of printing them"""
+        self._output.lines = []
+        try:
+            return step(), self._output.lines
+        finally:
+            self._output.lines = None
+        
+    def setup_working_directory(self):
+        """Setup a safe working directory for builds"""
+        # Check if we're in Program Files (protected directory)
+        current_dir = Path.cwd()
+        program_files_paths = [
+            Path(os.environ.get('PROGRAMFILES', 'C:\\Program Files')),
+            Path(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')),
+            Path(os.environ.get('PROGRAMW6432', 'C:\\Program Files'))
+        ]
+        
+        in_protected_dir = any(
+            str(current_dir).startswith(str(pf)) 
+            for pf in program_files_paths 
+            if pf.exists()
+        )
+        
+        if in_protected_dir:
+            # Use temp directory for builds
+            print("⚠️  Detected protected directory, using temp folder for build...")
+            self.root_dir = Path(tempfile.gettempdir()) / "VoicemeeterControl_Build"
+            self.root_dir.mkdir(exist_ok=True)
+            
+            # Copy source files to temp directory
+            print(f"📁 Working directory: {self.root_dir}")
+            source_present = self.list_files(current_dir)
+            
+            def copy_one(file):
+                src = current_dir / file
+                dst = self.root_dir / file
+                if file not in source_present:
+                    return None
+                if self.is_up_to_date(src, dst):
+                    return "Unchanged"
+                shutil.copy2(src, dst)
+                return "Copied"
+            
+            # The copies are independent, so let the OS overlap them. Results are reported in
+            # BUILD_INPUTS order so the log reads the same on every run.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(BUILD_INPUTS))) as executor:
+                futures = [executor.submit(copy_one, file) for file in BUILD_INPUTS]
+                for file, future in zip(BUILD_INPUTS, futures):
+                    status = future.result()
+                    if status:
+                        print(f"  ✓ {status} {file}")
+        else:
+            # Use current directory
+            self.root_dir = current_dir
+            
+        # Create build folders
+        self.build_folder = self.root_dir / "build_output"
+        self.build_folder.mkdir(exist_ok=True)
+        
+        # Setup subdirectories
+        self.dist_dir = self.build_folder / "dist"
+        self.build_dir = self.build_folder / "build"
+        self.installer_dir = self.build_folder / "installer"
+        self.temp_dir = self.build_folder / "temp"
+        
+        # Create all directories
+        for directory in [self.dist_dir, self.build_dir, self.installer_dir, self.temp_dir]:
+            directory.mkdir(exist_ok=True)
+            
+        print(f"\n📂 Build output folder: {self.build_folder}")
+        
+        # Files available in the build root, gathered with a single directory read
+        self._present = self.list_files(self.root_dir)
+
+    @staticmethod
+    def list_files(directory):
+        """Get the names of all files in a directory"""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    
+    @staticmethod
+    def is_up_to_date(src, dst):
+        """Check if dst is an unchanged copy of src (copy2 preserves mtime)"""
+        try:
+            src_stat = src.stat()
+            dst_stat = dst.stat()
+        except FileNotFoundError:
+            return False
+        return (src_stat.st_size == dst_stat.st_size
+                and src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+    def input_hash(self):
+        """Hash the inputs of the PyInstaller build"""
+        h = hashlib.blake2b(digest_size=16)
+        for file in BUILD_INPUTS:
+            path = self.root_dir / file
+            if path.exists():
+                h.update(file.encode())
+                h.update(path.read_bytes())
+        
+        # The spec and version info are generated from this script and the build paths
+        h.update(Path(__file__).read_bytes())
+        h.update(str(self.root_dir).encode())
+        h.update(str(RELEASE_BUILD).encode())
+        
+        # The interpreter and the installed packages are frozen into the executable too
+        h.update(sys.version.encode())
+        for dist in BUNDLED_DISTRIBUTIONS:
+            try:
+                version = importlib.metadata.version(dist)
+            except importlib.metadata.PackageNotFoundError:
+                version = 'missing'
+            h.update(f'{dist}=={version}'.encode())
+        
+        # A build made without an icon must not survive once one can be generated
+        h.update(str((self.build_folder / 'icon.ico').exists()).encode())
+        return h.hexdigest()
+    
+    def is_build_cached(self, build_hash):
+        """Check if the executable in dist was built from inputs with the given hash"""
+        exe_file = self.dist_dir / f'{APP_NAME.replace(" ", "")}.exe'
+        hash_file = self.build_folder / '.build_hash'
+        return (exe_file.exists() and hash_file.exists()
+                and hash_file.read_text() == build_hash)
+    
+    def clean_build_dirs(self):
+        """Clean previous build artifacts"""
+        print("\n🧹 Cleaning build directories...")
+        keep_dist = self.is_build_cached(self.input_hash())
+        for dir_path in [self.dist_dir, self.build_dir, self.temp_dir]:
+            if dir_path == self.dist_dir and keep_dist:
+                continue
+            if dir_path.exists():
+                shutil.rmtree(dir_path)
+                dir_path.mkdir(exist_ok=True)
+        
+    def create_spec_file(self):
+        """Create PyInstaller spec file"""
+        self.log("\n📝 Creating PyInstaller spec file...")
+        
+        # Convert paths to use forward slashes to avoid escape sequence issues
+        root_dir_str = str(self.root_dir).replace('\\', '/')
+        temp_dir_str = str(self.temp_dir).replace('\\', '/')
+        build_folder_str = str(self.build_folder).replace('\\', '/')
+        
+        spec_content = SPEC_TEMPLATE.substitute(
+            root_dir=root_dir_str,
+            temp_dir=temp_dir_str,
+            build_folder=build_folder_str,
+            exe_name=APP_NAME.replace(" ", ""),
+            upx=RELEASE_BUILD,
+            upx_exclude=UPX_EXCLUDE
+        )
+        
+        spec_file = self.temp_dir / 'voicemeeter_control.spec'
+        with open(spec_file, 'w', buffering=1 << 16) as f:
+            f.write(spec_content)
+        self.log(f"  ✓ Created: {spec_file}")
+        return spec_file
+    
+    def create_version_info(self):
+        """Create version info file for Windows executable"""
+        self.log("\n📋 Creating version info...")
+        
+        version_info = VERSION_INFO_TEMPLATE.substitute(
+            app_name=APP_NAME,
+            app_version=APP_VERSION,
+            app_publisher=APP_PUBLISHER,
+            exe_name=APP_NAME.replace(" ", "")
+        )
+        
+        version_file = self.temp_dir / 'version_info.txt'
+        with open(version_file, 'w', buffering=1 << 16) as f:
+            f.write(version_info)
+        self.log(f"  ✓ Created: {version_file}")
+    
+    def build_exe(self, spec_file):
+        """Build executable with PyInstaller"""
+        print("\n🔨 Building executable with PyInstaller...")
+        
+        # Skip PyInstaller entirely if nothing it depends on has changed
+        build_hash = self.input_hash()
+        hash_file = self.build_folder / '.build_hash'
+        if self.is_build_cached(build_hash):
+            print("  ✓ cached")
+            return
+        hash_file.unlink(missing_ok=True)
+        
+        # Change to root directory for build
+        original_dir = os.getcwd()
+        os.chdir(self.root_dir)
+        
+        # Keep PyInstaller's cache (UPX'd/stripped binaries) with this build's output rather
+        # than in the shared per-user location, so builds from different folders can run in
+        # parallel. Must be set before PyInstaller is imported; an existing value wins.
+        os.environ.setdefault('PYINSTALLER_CONFIG_DIR', str(self.build_folder / 'pyinstaller_config'))
+        
+        try:
+            # First ensure PyInstaller is installed
+            try:
+                import PyInstaller
+            except ImportError:
+                subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], 
+                             capture_output=True, check=True)
+                # Let the import system see the package pip just added
+                importlib.invalidate_caches()
+            
+            # Build the executable with custom paths, in this process rather than
+            # spawning the pyinstaller console script
+            from PyInstaller.__main__ import run as pyinstaller_run
+            
+            try:
+                pyinstaller_run([
+                    "--clean",
+                    "--distpath", str(self.dist_dir),
+                    "--workpath", str(self.build_dir),
+                    str(spec_file)
+                ])
+            except SystemExit as e:
+                if e.code:
+                    print(f"❌ Build failed: {e}")
+                    raise Exception("PyInstaller build failed")
+            
+            print("  ✓ Executable built successfully")
+            
+            # Copy icon.png to dist folder for the installer
+            icon_src = self.root_dir / "icon.png"
+            icon_dst = self.dist_dir / "icon.png"
+            if icon_src.exists():
+                shutil.copy2(icon_src, icon_dst)
+                print("  ✓ Copied icon.png to dist folder")
+            
+            hash_file.write_text(build_hash)
+            
+        finally:
+            os.chdir(original_dir)
+    
+    def create_inno_setup_script(self):
+        """Create Inno Setup script for installer"""
+        print("\n📦 Creating Inno Setup script...")
+        
+        # Convert paths for Inno Setup (uses Windows paths but doesn't have escape issues)
+        root_dir_str = str(self.root_dir)
+        dist_dir_str = str(self.dist_dir)
+        build_folder_str = str(self.build_folder)
+        exe_name = APP_NAME.replace(" ", "")
+        
+        inno_script = INNO_SETUP_TEMPLATE.substitute(
+            app_name=APP_NAME,
+            app_version=APP_VERSION,
+            app_publisher=APP_PUBLISHER,
+            app_url=APP_URL,
+            app_guid=APP_GUID,
+            exe_name=exe_name,
+            root_dir=root_dir_str,
+            dist_dir=dist_dir_str,
+            build_folder=build_folder_str
+        )
         
         setup_file = self.installer_dir / 'setup.iss'
-        with open(setup_file, 'w') as f:
+        with open(setup_file, 'w', buffering=1 << 16) as f:
             f.write(inno_script)
         print(f"  ✓ Created: {setup_file}")
     
@@ -349,7 +525,7 @@ end;
         """Create README.md if it doesn't exist"""
         readme_file = self.root_dir / 'README.md'
         if not readme_file.exists():
-            print("\n📄 Creating README.md...")
+            self.log("\n📄 Creating README.md...")
             readme_content = f"""# Voicemeeter Control
 
 Global hotkey control for Voicemeeter with visual notifications.
@@ -413,11 +589,11 @@ MIT License - see LICENSE file for details
 """
             with open(readme_file, 'w') as f:
                 f.write(readme_content)
-            print(f"  ✓ Created: {readme_file}")
+            self.log(f"  ✓ Created: {readme_file}")
     
     def convert_icons(self):
         """Convert PNG icons to ICO format"""
-        print("\n🎨 Converting icon...")
+        self.log("\n🎨 Converting icon...")
         
         try:
             from PIL import Image
@@ -426,10 +602,10 @@ MIT License - see LICENSE file for details
             if png_file.exists():
                 img = Image.open(png_file)
                 ico_file = self.build_folder / 'icon.ico'
-                img.save(ico_file, format='ICO', sizes=[(16,16), (32,32), (48,48), (256,256)])
-                print(f"  ✓ Converted icon.png to icon.ico")
+                self.save_ico(img, ico_file)
+                self.log(f"  ✓ Converted icon.png to icon.ico")
             else:
-                print(f"  ⚠️  icon.png not found, creating placeholder...")
+                self.log(f"  ⚠️  icon.png not found, creating placeholder...")
                 # Create placeholder with VM initials
                 img = Image.new('RGBA', (256, 256), (64, 64, 64, 255))
                 from PIL import ImageDraw, ImageFont
@@ -442,11 +618,28 @@ MIT License - see LICENSE file for details
                 png_file = self.build_folder / 'icon.png'
                 img.save(png_file)
                 ico_file = self.build_folder / 'icon.ico'
-                img.save(ico_file, format='ICO', sizes=[(16,16), (32,32), (48,48), (256,256)])
+                self.save_ico(img, ico_file)
                     
         except Exception as e:
-            print(f"  ⚠️  Could not convert icon: {e}")
-            print("     Please convert manually or use existing ICO file")
+            self.log(f"  ⚠️  Could not convert icon: {e}")
+            self.log("     Please convert manually or use existing ICO file")
+    
+    def save_ico(self, img, ico_file):
+        """
+        Save an image as a multi-size ICO file.
+        Resamples to the largest size once, then steps down from each size to the next
+        instead of resampling the source for every size.
+        """
+        from PIL import Image
+        
+        # Only sizes the source can fill without upscaling, like Pillow's own ICO writer
+        sizes = [size for size in ICON_SIZES
+                 if size[0] <= img.width and size[1] <= img.height] or ICON_SIZES[-1:]
+        
+        frames = [img.convert('RGBA').resize(sizes[0], Image.LANCZOS)]
+        for size in sizes[1:]:
+            frames.append(frames[-1].resize(size, Image.BOX))
+        frames[0].save(ico_file, format='ICO', sizes=sizes, append_images=frames[1:])
     
     def build_installer(self):
         """Main build process"""
@@ -456,11 +649,7 @@ MIT License - see LICENSE file for details
         # Check for required files
         required_files = ['voicemeeter_control.py', 'volume_display.py', 
                          'hotkey_handler.py', 'config.yaml', 'LICENSE']
-        missing_files = []
-        
-        for file in required_files:
-            if not (self.root_dir / file).exists():
-                missing_files.append(file)
+        missing_files = [file for file in required_files if file not in self._present]
         
         if missing_files:
             print("\n❌ Missing required files:")
@@ -473,13 +662,25 @@ MIT License - see LICENSE file for details
             # Step 1: Clean
             self.clean_build_dirs()
             
-            # Step 2: Create necessary files
-            self.create_readme()
-            self.create_version_info()
-            self.convert_icons()
+            # Step 2: Create necessary files and the spec. These are independent of each
+            # other (the spec only references the version info and icon paths), so run them
+            # concurrently; icon conversion happens mostly in PIL's C code. Each step's
+            # output is printed here, in order, so the console reads the same as a serial run.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self.run_buffered, step)
+                    for step in (self.create_readme, self.create_version_info,
+                                 self.convert_icons, self.create_spec_file)
+                ]
+                results = []
+                for future in futures:
+                    result, lines = future.result()
+                    if lines:
+                        print("\n".join(lines))
+                    results.append(result)
+                spec_file = results[-1]
             
-            # Step 3: Create spec and build executable
-            spec_file = self.create_spec_file()
+            # Step 3: Build executable
             self.build_exe(spec_file)
             
             # Step 4: Create installer script
@@ -1,7 +1,8 @@
+import ctypes
 import logging
+import threading
 import time
-
-import keyboard
+from ctypes import wintypes
 
 # Toggle logging on/off
 ENABLE_LOGGING = False
@@ -18,41 +19,86 @@ if ENABLE_LOGGING:
 	)
 	logger = logging.getLogger(__name__)
 else:
-	class DummyLogger:
-		"""Logger that does nothing when called"""
-		def __getattr__(self, name):
-			"""Accepts anything, does nothing"""
-			return lambda *args, **kwargs: None
+	# Real logger that drops everything; disabled calls return early on isEnabledFor
+	logger = logging.getLogger(__name__)
+	logger.addHandler(logging.NullHandler())
+	logger.setLevel(logging.CRITICAL + 1)
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32")
+
+user32.RegisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+user32.UnregisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int)
+user32.GetMessageW.argtypes = (ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT)
+user32.PeekMessageW.argtypes = (
+	ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT
+)
+user32.PostThreadMessageW.argtypes = (wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+user32.MsgWaitForMultipleObjects.argtypes = (
+	wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL, wintypes.DWORD, wintypes.DWORD
+)
+user32.MsgWaitForMultipleObjects.restype = wintypes.DWORD
+user32.GetAsyncKeyState.argtypes = (ctypes.c_int,)
+user32.GetAsyncKeyState.restype = ctypes.c_short
+
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+WM_USER = 0x0400
+PM_NOREMOVE = 0x0000
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+WAIT_TIMEOUT = 0x0102
+
+# RegisterHotKey modifier flags for each modifier name used in config hotkeys
+MODIFIER_FLAGS = {
+	"alt": 0x0001,
+	"ctrl": 0x0002,
+	"shift": 0x0004,
+	"win": 0x0008
+}
 
+# Virtual-key codes for the key names accepted in config hotkeys (listed in the README)
+VIRTUAL_KEYS = {
+	"backspace": 0x08, "tab": 0x09, "enter": 0x0D, "pause": 0x13, "caps lock": 0x14,
+	"esc": 0x1B, "space": 0x20, "page up": 0x21, "page down": 0x22, "end": 0x23,
+	"home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+	"print screen": 0x2C, "insert": 0x2D, "delete": 0x2E, "num lock": 0x90,
+	"scroll lock": 0x91, "volume mute": 0xAD, "volume down": 0xAE, "volume up": 0xAF,
+	"next track": 0xB0, "previous track": 0xB1, "stop media": 0xB2,
+	"play/pause media": 0xB3, ";": 0xBA, "=": 0xBB, ",": 0xBC, "-": 0xBD, ".": 0xBE,
+	"/": 0xBF, "`": 0xC0, "[": 0xDB, "\\": 0xDC, "]": 0xDD, "'": 0xDE,
+	"windows": 0x5B, "left windows": 0x5B, "right windows": 0x5C, "menu": 0x5D,
+	**{f"num {n}": 0x60 + n for n in range(10)},
+	**{chr(code).lower(): code for code in range(ord("A"), ord("Z") + 1)},
+	**{chr(code): code for code in range(ord("0"), ord("9") + 1)},
+	**{f"f{n}": 0x6F + n for n in range(1, 25)}
+}
 
-	logger = DummyLogger()
+# How often (in milliseconds) held hotkeys are checked for release. Only runs while one is held.
+RELEASE_POLL_MS = 20
 
 class HotkeyHandler:
 	"""
-	A keyboard hotkey manager that supports multiple modifier key combinations with repeat 
-	functionality.
+	A global hotkey manager built on the Windows RegisterHotKey API, with repeat functionality.
 
-	This class provides a system for binding keyboard shortcuts to actions, supporting multiple
-	modifier keys (Ctrl, Alt, Shift) in various combinations. It includes features for initial
-	key press handling, key repeat with customizable delays, and automatic cleanup of keyboard
-	listeners.
+	This class registers each keyboard shortcut with Windows, which filters key presses itself
+	and only posts a WM_HOTKEY message for the registered combinations. A background thread
+	waits on those messages, so unrelated key presses never reach Python and the handler is idle
+	until a hotkey is pressed.
 
 	Features:
-		- Support for multiple modifier combinations (Ctrl, Alt, Shift)
+		- Support for multiple modifier combinations (Ctrl, Alt, Shift, Win)
 		- Customizable repeat delay and interval
-		- Automatic suppression of original key events
+		- Registered combinations are consumed; everything else reaches other applications untouched
 		- Clean handling of key state management
 
 	Example:
 		hotkey_actions = {
-			'up': [
-				{
-					'modifiers': ('ctrl', 'shift'),
-					'callback': some_function,
-					'args': (1, 2),
-					'kwargs': {'param': 'value'}
-				}
-			]
+			('up', frozenset({'ctrl', 'shift'})): {
+				'callback': some_function,
+				'args': (1, 2),
+				'kwargs': {'param': 'value'}
+			}
 		}
 		handler = HotkeyHandler(hotkey_actions, repeat_delay=0.5, repeat_interval=0.1)
 	"""
@@ -61,96 +107,147 @@ class HotkeyHandler:
 		Initialize hotkey handler with support for multiple modifier combinations
 
 		Args:
-			hotkey_actions (dict): A dictionary mapping main keys to lists of action dictionaries.
-				Each action dictionary must contain:
-				- modifiers (tuple): Required modifier keys ('ctrl', 'alt', 'shift')
-				- callback (callable): Function to execute when hotkey is triggered
+			hotkey_actions (dict): A dictionary mapping (main key, frozenset of required modifier
+				keys ('ctrl', 'alt', 'shift', 'win')) to an action dictionary, which must contain:
+				- callback (callable): Function to execute when hotkey is triggered. Called on the
+				  handler's own thread.
 				- args (tuple): Positional arguments for the callback
 				- kwargs (dict, optional): Keyword arguments for the callback
 			repeat_delay (float, optional): Time in seconds before key repeat begins. Defaults to 0.5.
 			repeat_interval (float, optional): Time in seconds between repeated triggers. Defaults to 0.1.
+
+		Hotkeys with unsupported key names, or that Windows refuses to register (usually because
+		another application already holds them), are listed in failed_hotkeys once this returns.
 		"""
 		self.hotkey_actions = hotkey_actions
 		self.repeat_delay = repeat_delay
 		self.repeat_interval = repeat_interval
-		self.key_states = {}
+		# Repeat timing runs on integer monotonic nanoseconds
+		self._delay_ns = int(repeat_delay * 1e9)
+		self._interval_ns = int(repeat_interval * 1e9)
+		self._held = [] # Actions whose main key hasn't been released yet
+		self._thread_id = None
+		self._ready = threading.Event()
+		self.failed_hotkeys = [] # "modifiers+key" names of hotkeys that aren't active
 		self.setup_listeners()
 
 	def setup_listeners(self):
-		"""Set up keyboard listeners for all defined hotkeys"""
-		for key in self.hotkey_actions.keys():
-			keyboard.on_press_key(key, self.on_key_press, suppress=True)
-			keyboard.on_release_key(key, self.on_key_release)
-
-	def get_pressed_modifiers(self):
-		"""Get currently pressed modifier keys"""
-		modifiers = []
-		for mod in ["ctrl", "alt", "shift"]:
-			if keyboard.is_pressed(mod):
-				modifiers.append(mod)
-		return tuple(sorted(modifiers))
-
-	def find_matching_action(self, key, current_modifiers):
-		"""Find the action that matches the current modifier combination"""
-		if key not in self.hotkey_actions:
-			return None
-
-		for action in self.hotkey_actions[key]:
-			if action["modifiers"] == current_modifiers:
-				return action
-		return None
-
-	def on_key_press(self, event):
-		"""Handle key press events with support for multiple modifier combinations"""
-		key = event.name
-		current_time = time.time()
-		current_modifiers = self.get_pressed_modifiers()
-
-		# Find matching action for current modifier combination
-		action = self.find_matching_action(key, current_modifiers)
-		if not action:
-			print(f"no action: {action}")
-			print(key)
-			keyboard.press(key)
-			return
-
-		# Initialize or update key state
-		state_key = (key, current_modifiers)
-		if state_key not in self.key_states:
-			self.key_states[state_key] = {
-				"pressed": False,
-				"last_trigger": 0,
-				"repeat_started": False
-			}
+		"""Translate the hotkeys to RegisterHotKey arguments and start the message loop thread"""
+		# Hotkey ID -> (name, modifier flags, virtual-key code, action)
+		self._registrations = {}
+		for (key, modifiers), action in self.hotkey_actions.items():
+			name = "+".join((*sorted(modifiers), key))
+			vk = VIRTUAL_KEYS.get(key.lower())
+			flags = 0
+			for modifier in modifiers:
+				flag = MODIFIER_FLAGS.get(modifier.lower())
+				if flag is None:
+					vk = None
+					break
+				flags |= flag
+
+			if vk is None:
+				logger.error(f"Unsupported hotkey: {name}")
+				self.failed_hotkeys.append(name)
+				continue
+
+			# Key state lives on the action itself rather than in a side table
+			action["_vk"] = vk
+			action["_pressed"] = False
+			action["_last"] = 0
+			action["_repeat"] = False
+			self._registrations[len(self._registrations) + 1] = (name, flags, vk, action)
+
+		# Hotkeys are delivered to the thread that registered them, so the thread does both
+		self._thread = threading.Thread(target=self.run, name="HotkeyHandler", daemon=True)
+		self._thread.start()
+		self._ready.wait()
+
+	def run(self):
+		"""Register the hotkeys and pump this thread's messages until stop() is called"""
+		msg = wintypes.MSG()
+		try:
+			# The constructor waits on _ready, so it must be set however registration ends
+			try:
+				self._thread_id = kernel32.GetCurrentThreadId()
+				# Create the thread's message queue before stop() might post to it
+				user32.PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)
+
+				for hotkey_id, (name, flags, vk, action) in self._registrations.items():
+					if not user32.RegisterHotKey(None, hotkey_id, flags, vk):
+						logger.error(f"Could not register hotkey {name}: {ctypes.WinError(ctypes.get_last_error())}")
+						self.failed_hotkeys.append(name)
+			except Exception:
+				self.failed_hotkeys += [name for name, *_ in self._registrations.values()]
+				raise
+			finally:
+				self._ready.set()
+
+			while True:
+				if not self._held:
+					# Nothing held: block until Windows posts a hotkey (or WM_QUIT)
+					if user32.GetMessageW(ctypes.byref(msg), None, 0, 0) <= 0:
+						return
+					self.on_message(msg)
+					continue
+
+				# Something is held: wake up periodically to notice its release
+				if user32.MsgWaitForMultipleObjects(0, None, False, RELEASE_POLL_MS, QS_ALLINPUT) == WAIT_TIMEOUT:
+					self.check_released()
+					continue
+
+				while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+					if msg.message == WM_QUIT:
+						return
+					self.on_message(msg)
+		finally:
+			for hotkey_id in self._registrations:
+				user32.UnregisterHotKey(None, hotkey_id)
+
+	def on_message(self, msg):
+		"""Dispatch a WM_HOTKEY message to its action; the hotkey ID is in wParam"""
+		if msg.message == WM_HOTKEY:
+			registration = self._registrations.get(msg.wParam)
+			if registration:
+				self.on_hotkey(registration[3])
+
+	def on_hotkey(self, action):
+		"""
+		Handle a hotkey press. Windows re-posts WM_HOTKEY at the keyboard repeat rate while the
+		key is held; those are throttled to repeat_delay and repeat_interval.
+		"""
+		now_ns = time.monotonic_ns()
 
 		# Handle initial press and repeats
-		if not self.key_states[state_key]["pressed"]:
+		if not action["_pressed"]:
 			self.trigger_action(action)
-			self.key_states[state_key]["pressed"] = True
-			self.key_states[state_key]["last_trigger"] = current_time
-			self.key_states[state_key]["repeat_started"] = False
+			action["_pressed"] = True
+			action["_last"] = now_ns
+			action["_repeat"] = False
+			self._held.append(action)
 		else:
-			time_held = current_time - self.key_states[state_key]["last_trigger"]
+			held_ns = now_ns - action["_last"]
 
-			if not self.key_states[state_key]["repeat_started"]:
-				if time_held >= self.repeat_delay:
-					self.key_states[state_key]["repeat_started"] = True
+			if not action["_repeat"]:
+				if held_ns >= self._delay_ns:
+					action["_repeat"] = True
 					self.trigger_action(action)
-					self.key_states[state_key]["last_trigger"] = current_time
+					action["_last"] = now_ns
 			else:
-				if time_held >= self.repeat_interval:
+				if held_ns >= self._interval_ns:
 					self.trigger_action(action)
-					self.key_states[state_key]["last_trigger"] = current_time
+					action["_last"] = now_ns
 
-	def on_key_release(self, event):
-		"""Reset key state on release"""
-		key = event.name
-		current_modifiers = self.get_pressed_modifiers()
-		state_key = (key, current_modifiers)
-
-		if state_key in self.key_states:
-			self.key_states[state_key]["pressed"] = False
-			self.key_states[state_key]["repeat_started"] = False
+	def check_released(self):
+		"""Reset the state of held actions whose main key is no longer down"""
+		still_held = []
+		for action in self._held:
+			if user32.GetAsyncKeyState(action["_vk"]) & 0x8000:
+				still_held.append(action)
+			else:
+				action["_pressed"] = False
+				action["_repeat"] = False
+		self._held = still_held
 
 	def trigger_action(self, action):
 		"""Execute the callback function with its arguments"""
@@ -160,5 +257,10 @@ class HotkeyHandler:
 		callback(*args, **kwargs)
 
 	def stop(self):
-		"""Clean up keyboard listeners"""
-		keyboard.unhook_all()
+		"""Stop the message loop thread, which unregisters the hotkeys on its way out"""
+		if self._thread_id is not None:
+			user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+		self._thread.join(timeout=1)
+		# Windows reuses thread IDs, so never post to this one again once the thread is gone
+		if not self._thread.is_alive():
+			self._thread_id = None
@@ -1,14 +1,13 @@
+import json
 import logging
 import os
-import subprocess
 import sys
 import winreg
 
 from PyQt5.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import pyqtSignal, QObject
+from PyQt5.QtCore import pyqtSignal, QObject, Qt, QTimer
 import voicemeeter
-import yaml
 
 from hotkey_handler import HotkeyHandler
 from volume_display import VolumeDisplay
@@ -28,21 +27,40 @@ if ENABLE_LOGGING:
 	)
 	logger = logging.getLogger(__name__)
 else:
+	def _noop(*args, **kwargs):
+		"""Accepts anything, does nothing"""
+
 	class DummyLogger:
 		"""Logger that does nothing when called"""
+		__slots__ = ()
+		debug = info = warning = error = exception = critical = staticmethod(_noop)
+
 		def __getattr__(self, name):
-			"""Accepts anything, does nothing"""
-			return lambda *args, **kwargs: None
+			"""Any other logger method is the same shared no-op"""
+			return _noop
 
 	logger = DummyLogger()
 
+# Window (in milliseconds) after a volume step in which further steps queued behind a busy
+# GUI thread are merged into one gain write. Held-key repeats are already spaced further apart.
+VOLUME_COALESCE_MS = 30
+
+# Interval (in milliseconds) at which VoiceMeeter's dirty flag is polled
+DIRTY_POLL_MS = 200
+
+# Suffix of the JSON config cache written next to the YAML file
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
 
 class NotificationSignals(QObject):
 	"""
     Handles Qt signals for system notifications.
     Used to safely emit notification signals across threads. (I think)
+    hotkey_triggered carries a hotkey's action handler and its arguments from the hotkey
+    handler's thread to the GUI thread, where all VoiceMeeter access happens.
     """
 	show_notification = pyqtSignal(str)
+	hotkey_triggered = pyqtSignal(object, object)
 
 
 class VoiceMeeterController:
@@ -62,6 +80,13 @@ class VoiceMeeterController:
 		- Windows startup integration
 		- Config file access
     """
+	__slots__ = (
+		"keyboard_listener", "config", "settings", "config_path", "app", "app_name", "vm",
+		"paused", "_startup_cached", "pending_volume", "needs_update", "dirty_timer",
+		"display", "notification_signals", "tray", "_vol_str",
+		"__weakref__" # PyQt holds weak references to the bound methods connected to signals
+	)
+
 	def __init__(self, config_path):
 		"""
         Initialize the VoiceMeeter controller with configuration.
@@ -80,6 +105,15 @@ class VoiceMeeterController:
 		self.vm.login()
 
 		self.paused = False
+		# The registry value only changes through toggle_startup, so read it once
+		self._startup_cached = self.is_startup_enabled()
+		self.pending_volume = {} # Channel index -> [prefix, summed delta] awaiting flush_volume
+
+		# Poll VoiceMeeter's dirty flag in the background so hotkeys only check a bool
+		self.needs_update = False
+		self.dirty_timer = QTimer()
+		self.dirty_timer.timeout.connect(self.poll_dirty)
+		self.dirty_timer.start(DIRTY_POLL_MS)
 
 		# Set up notification system
 		self.display = VolumeDisplay()
@@ -87,6 +121,9 @@ class VoiceMeeterController:
 		self.notification_signals.show_notification.connect(
 			self.display.show_notification
 		)
+		self.notification_signals.hotkey_triggered.connect(
+			self.handle_hotkey, Qt.QueuedConnection
+		)
 
 		self.setup_hotkeys()
 
@@ -101,13 +138,43 @@ class VoiceMeeterController:
 	def load_config(self, config_path):
 		"""
         Load and parse the YAML configuration file.
+        The parsed config is cached next to the file and reused while the file's
+        modification time and size are unchanged.
         
         Args:
             config_path (str): Path to the configuration file
         """
-		with open(config_path, "r") as f:
-			self.config = yaml.safe_load(f)
-		logger.info(f"Loaded configuration from {config_path}")
+		stat = os.stat(config_path)
+		stamp = (stat.st_mtime_ns, stat.st_size)
+		cache_path = config_path + CONFIG_CACHE_SUFFIX
+		self.config = None
+		try:
+			# JSON rather than pickle, so the cache can only ever hold data
+			with open(cache_path, "r", encoding="utf-8") as f:
+				cached_mtime, cached_size, cached_config = json.load(f)
+			if (cached_mtime, cached_size) == stamp:
+				self.config = cached_config
+				logger.info(f"Loaded cached configuration for {config_path}")
+		except Exception as e:
+			logger.debug(f"Config cache not used: {e}")
+
+		if self.config is None:
+			# PyYAML is only imported when the cache can't be used. Prefer the LibYAML-backed
+			# safe loader when PyYAML was built with it.
+			import yaml
+			loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+			with open(config_path, "r") as f:
+				self.config = yaml.load(f, Loader=loader)
+			logger.info(f"Loaded configuration from {config_path}")
+
+			# Only cache configs JSON reproduces exactly (e.g. not ones with integer keys)
+			cache_data = json.dumps([*stamp, self.config])
+			if json.loads(cache_data)[2] == self.config:
+				try:
+					with open(cache_path, "w", encoding="utf-8") as f:
+						f.write(cache_data)
+				except OSError as e:
+					logger.debug(f"Could not write config cache: {e}")
 
 		self.settings = self.config["settings"]
 
@@ -118,15 +185,11 @@ class VoiceMeeterController:
 	def is_startup_enabled(self):
 		"""Check if the app is set to run on Windows startup"""
 		try:
-			registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-			key = winreg.OpenKey(registry, self.get_startup_path(), 0, winreg.KEY_READ)
-			try:
-				value, _ = winreg.QueryValueEx(key, self.app_name)
-				winreg.CloseKey(key)
-				return True
-			except WindowsError:
-				winreg.CloseKey(key)
-				return False
+			with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.get_startup_path(), 0, winreg.KEY_READ) as key:
+				winreg.QueryValueEx(key, self.app_name)
+			return True
+		except FileNotFoundError:
+			return False
 		except Exception as e:
 			logger.debug(f"Could not check startup status: {e}")
 			return False
@@ -163,9 +226,10 @@ class VoiceMeeterController:
 
 	def toggle_startup(self):
 		"""Toggle Windows startup setting"""
-		current = self.is_startup_enabled()
+		current = self._startup_cached
 		success = self.set_startup(not current)
 		if success:
+			self._startup_cached = not current
 			status = "enabled" if not current else "disabled"
 			self.notification_signals.show_notification.emit(f"Startup {status}")
 
@@ -179,6 +243,7 @@ class VoiceMeeterController:
 			logger.error(f"Failed to open config file: {e}")
 			# Fallback to notepad
 			try:
+				import subprocess
 				subprocess.Popen(["notepad.exe", self.config_path])
 			except Exception as e2:
 				logger.error(f"Failed to open with notepad: {e2}")
@@ -205,7 +270,7 @@ class VoiceMeeterController:
 		# Start with Windows action
 		startup_action = menu.addAction("Start with Windows")
 		startup_action.setCheckable(True)
-		startup_action.setChecked(self.is_startup_enabled())
+		startup_action.setChecked(self._startup_cached)
 		startup_action.triggered.connect(self.toggle_startup)
 		
 		# Separator
@@ -236,6 +301,8 @@ class VoiceMeeterController:
         Restart the application by launching a new instance and terminating the current one.
         Preserves the console/windowless state of the current instance.
         """
+		import subprocess
+		launched = False
 		try:
 			logger.info("Restarting Voicemeeter Control...")
 
@@ -243,6 +310,9 @@ class VoiceMeeterController:
 			script_path = os.path.abspath(sys.argv[0])
 			python_exe = sys.executable
 
+			# Hotkey registrations are exclusive, so release ours before the new instance claims them
+			self.keyboard_listener.stop()
+
 			# Start new instance
 			if python_exe.endswith("pythonw.exe"):
 				# If running as windowless, start new windowless instance
@@ -251,17 +321,23 @@ class VoiceMeeterController:
 				# If running with console, preserve that
 				subprocess.Popen([python_exe, script_path],
 								 creationflags=subprocess.CREATE_NEW_CONSOLE)
+			launched = True
 
 			self.quit()
 
 		except Exception as e:
-			logging.error(f"Error during restart: {str(e)}")
+			logger.error(f"Error during restart: {str(e)}")
+			# No new instance took over the hotkeys, so keep this one usable
+			if not launched:
+				self.setup_hotkeys()
+			self.notification_signals.show_notification.emit("Restart failed")
 
 	def quit(self):
 		"""
         Clean up and terminate the application.
         Logs out of VoiceMeeter, stops the keyboard listener, and exits the Qt application.
         """
+		self.dirty_timer.stop()
 		self.vm.logout()
 		self.keyboard_listener.stop()
 		self.app.quit()
@@ -272,15 +348,39 @@ class VoiceMeeterController:
         Configure global hotkeys based on the loaded configuration.
         Maps hotkeys to specific channels and actions (mute, volume up/down).
         Supports multiple modifier key combinations for each action.
+        
+        Hotkeys are passed to HotkeyHandler as a flat dict keyed by
+        (main_key, frozenset(modifiers)), e.g. ("f14", frozenset({"ctrl"})).
         """
 		hotkeys = {}
+		step = self.settings["volume_step"]
+
+		# Notification text for every gain reachable in whole steps from 0 dB, plus the limits
+		self._vol_str = {}
+		if step > 0:
+			grid = [i * step for i in range(-int(60 / step), int(12 / step) + 1)] + [-60.0, 12.0]
+			self._vol_str = {round(volume, 1): f"{volume:.1f} dB" for volume in grid}
 
 		# Iterate through each channel and its actions
 		for channel, actions in self.config["hotkeys"].items():
 			channel_index = self.config["channels"][channel]
+			title = channel.title()
+			prefix = f"{title}: "
+
+			# Resolve each action type to its handler and arguments (including the finished
+			# notification texts) once, up front
+			handlers = {
+				"mute": (self.toggle_mute, (channel_index, prefix + "Muted", prefix + "Unmuted")),
+				"up": (self.change_volume, (channel_index, prefix, step)),
+				"down": (self.change_volume, (channel_index, prefix, -step))
+			}
 
 			# Process each action type (mute, up, down)
 			for action, keys in actions.items():
+				if action not in handlers:
+					logger.error(f"Unknown action '{action}' for {channel}")
+					continue
+
 				# Convert single string to list for consistent processing
 				key_list = keys if isinstance(keys, list) else [keys]
 
@@ -289,59 +389,130 @@ class VoiceMeeterController:
 					# Process the key
 					hotkey_split = key.split("+")
 					main_key = hotkey_split.pop()
-					modifiers = tuple(sorted(hotkey_split)) # Sort modifiers for consistent comparison
-
-					# Create or update the mapping for this main key
-					if main_key not in hotkeys:
-						hotkeys[main_key] = []
+					modifiers = frozenset(hotkey_split) # Modifier order doesn't matter
 
-					hotkeys[main_key].append({
-						"modifiers": modifiers,
-						"callback": self.handle_hotkey,
-						"args": (channel, action, channel_index)
-					})
+					# The hotkey handler's thread only queues the action; handle_hotkey runs it
+					# on the GUI thread
+					hotkeys[(main_key, modifiers)] = {
+						"callback": self.notification_signals.hotkey_triggered.emit,
+						"args": handlers[action]
+					}
 
 		handler = HotkeyHandler(hotkeys)
 		self.keyboard_listener = handler
 
-	def handle_hotkey(self, channel, action, index):
+		# Unsupported or already-taken hotkeys would otherwise just never fire
+		if handler.failed_hotkeys:
+			failed = ", ".join(handler.failed_hotkeys)
+			logger.error(f"Hotkeys unavailable: {failed}")
+			self.notification_signals.show_notification.emit(f"Hotkeys unavailable: {failed}")
+
+	def handle_hotkey(self, action_handler, args):
 		"""
-        Process hotkey events and apply the corresponding action to VoiceMeeter.
+        Run a hotkey's action against VoiceMeeter unless hotkeys are paused.
+        Connected to hotkey_triggered with a queued connection, so this always runs on the
+        GUI thread.
         
         Args:
-            channel (str): Name of the channel to modify
-            action (str): Action to perform ('mute', 'up', or 'down')
-            index (int): VoiceMeeter channel index
+            action_handler (callable): Action to perform (toggle_mute or change_volume)
+            args (tuple): Arguments for the action, prepared in setup_hotkeys
         """
 		if self.paused:
 			return
 			
 		try:
-			if self.vm.dirty:
+			if self.needs_update:
+				self.needs_update = False
 				self.update()
-			current_volume = self.vm.inputs[index].gain
-
-			if action == "mute":
-				new_state = not self.vm.inputs[index].mute
-				self.vm.inputs[index].mute = new_state
-				status = "Muted" if new_state else "Unmuted"
-				self.notification_signals.show_notification.emit(f"{channel.title()}: {status}")
-				logger.info(f"{channel} {status.lower()}")
-
-			elif action == "up":
-				new_volume = min(12.0, current_volume + self.settings["volume_step"])
-				self.vm.inputs[index].gain = new_volume
-				self.notification_signals.show_notification.emit(f"{channel.title()}: {new_volume:.1f} dB")
-				logger.info(f"{channel} volume increased to {new_volume:.1f} dB")
-
-			elif action == "down":
-				new_volume = max(-60.0, current_volume - self.settings["volume_step"])
-				self.vm.inputs[index].gain = new_volume
-				self.notification_signals.show_notification.emit(f"{channel.title()}: {new_volume:.1f} dB")
-				logger.info(f"{channel} volume decreased to {new_volume:.1f} dB")
+			action_handler(*args)
+
+		except Exception as e:
+			if ENABLE_LOGGING:
+				logger.error(f"Error handling hotkey {action_handler.__name__}{args}: {str(e)}")
+
+	def toggle_mute(self, index, muted_msg, unmuted_msg):
+		"""
+        Toggle mute on a VoiceMeeter input and show the new state.
+        
+        Args:
+            index (int): VoiceMeeter channel index
+            muted_msg (str): Notification shown when the channel becomes muted
+            unmuted_msg (str): Notification shown when the channel becomes unmuted
+        """
+		inp = self.vm.inputs[index]
+		new_state = not inp.mute
+		inp.mute = new_state
+		message = muted_msg if new_state else unmuted_msg
+		self.notification_signals.show_notification.emit(message)
+		if ENABLE_LOGGING:
+			logger.info(message)
+
+	def change_volume(self, index, prefix, delta):
+		"""
+        Change the gain of a VoiceMeeter input.
+        The first change is applied immediately. Changes arriving within VOLUME_COALESCE_MS
+        after it (steps that queued up while the GUI thread was busy) are summed and applied
+        with a single write by flush_volume.
+        
+        Args:
+            index (int): VoiceMeeter channel index
+            prefix (str): Channel name prefix for the notification, e.g. "Desktop: "
+            delta (float): Gain change in dB (negative to lower the volume)
+        """
+		pending = self.pending_volume.get(index)
+		if pending is not None:
+			pending[1] += delta
+			return
+
+		self.pending_volume[index] = [prefix, 0.0]
+		self.apply_volume(index, prefix, delta)
+		QTimer.singleShot(VOLUME_COALESCE_MS, lambda: self.flush_volume(index))
+
+	def flush_volume(self, index):
+		"""
+        Apply the gain changes summed since a channel's last immediate change, if any.
+        
+        Args:
+            index (int): VoiceMeeter channel index
+        """
+		prefix, delta = self.pending_volume.pop(index)
+		if delta:
+			self.apply_volume(index, prefix, delta)
 
+	def apply_volume(self, index, prefix, delta):
+		"""
+        Apply a gain change to a VoiceMeeter input, clamped to [-60, 12] dB,
+        and show the new level.
+        
+        Args:
+            index (int): VoiceMeeter channel index
+            prefix (str): Channel name prefix for the notification, e.g. "Desktop: "
+            delta (float): Gain change in dB (negative to lower the volume)
+        """
+		try:
+			inp = self.vm.inputs[index]
+			new_volume = max(-60.0, min(12.0, inp.gain + delta))
+			inp.gain = new_volume
+			volume_str = self._vol_str.get(round(new_volume, 1)) or f"{new_volume:.1f} dB"
+			self.notification_signals.show_notification.emit(prefix + volume_str)
+			if ENABLE_LOGGING:
+				logger.info(f"{prefix}volume {'increased' if delta > 0 else 'decreased'} to {new_volume:.1f} dB")
+
+		except Exception as e:
+			if ENABLE_LOGGING:
+				logger.error(f"{prefix}error changing volume: {str(e)}")
+
+	def poll_dirty(self):
+		"""
+        Check whether VoiceMeeter parameters changed since the last poll.
+        Runs on dirty_timer; the next hotkey refreshes the state if they did.
+        """
+		try:
+			if self.vm.dirty:
+				self.needs_update = True
 		except Exception as e:
-			logger.error(f"Error handling hotkey for {channel}: {str(e)}")
+			if ENABLE_LOGGING:
+				logger.error(f"Error polling VoiceMeeter: {str(e)}")
 
 	def update(self):
 		"""
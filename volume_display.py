@@ -1,7 +1,6 @@
 import logging
-from threading import Lock
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QThread, QTimer
 from PyQt5.QtGui import QFontMetrics
 from PyQt5.QtWidgets import QApplication, QHBoxLayout, QLabel, QWidget
 
@@ -20,14 +19,23 @@ if ENABLE_LOGGING:
 	)
 	logger = logging.getLogger(__name__)
 else:
+	def _noop(*args, **kwargs):
+		"""Accepts anything, does nothing"""
+
 	class DummyLogger:
 		"""Logger that does nothing when called"""
+		__slots__ = ()
+		debug = info = warning = error = exception = critical = staticmethod(_noop)
+
 		def __getattr__(self, name):
-			"""Accepts anything, does nothing"""
-			return lambda *args, **kwargs: None
+			"""Any other logger method is the same shared no-op"""
+			return _noop
 
 	logger = DummyLogger()
 
+# Maximum number of notification texts whose widths are remembered
+WIDTH_CACHE_SIZE = 256
+
 
 class VolumeDisplay(QWidget):
 	"""
@@ -37,12 +45,15 @@ class VolumeDisplay(QWidget):
 	- Frameless, always-on-top window
 	- Semi-transparent background
 	- Auto-hiding after a short delay
-	- Thread-safe notification display
+	- Notifications shown on the GUI thread (via queued signals from other threads)
 	- Dynamic sizing based on content
 	- Positioned in the bottom-right corner
 	- Right-aligned text with consistent styling
 	- Non-intrusive (doesn't steal focus)
 	"""
+	# Attributes read on every notification. The sip base class still provides a __dict__
+	# for everything else (e.g. layout), so only the hot ones are slotted.
+	__slots__ = ("hide_timer", "label", "_metrics", "_width_cache", "_screen", "_scr_w", "_scr_h")
 
 	def __init__(self):
 		"""
@@ -52,7 +63,12 @@ class VolumeDisplay(QWidget):
 		super().__init__()
 		self.hide_timer = None
 		self.init_ui()
-		self.timer_lock = Lock()
+
+		# Cache the primary screen's size and keep it current as displays are reconfigured
+		self._screen = None
+		self._scr_w = self._scr_h = 0
+		self.track_screen(QApplication.primaryScreen())
+		QApplication.instance().primaryScreenChanged.connect(self.track_screen)
 
 	def init_ui(self):
 		"""
@@ -89,9 +105,42 @@ class VolumeDisplay(QWidget):
 		self.hide_timer.timeout.connect(self.hide)
 		self.hide_timer.setSingleShot(True)
 
+		# The label's font is fixed by its stylesheet, so measure text with one metrics object
+		# (polish first so the stylesheet font is applied) and remember widths already seen
+		self.label.ensurePolished()
+		self._metrics = QFontMetrics(self.label.font())
+		self._width_cache = {}
+
 		# Initialize with minimum size
 		self.update_size("")
 
+	def track_screen(self, screen):
+		"""
+		Follow the screen notifications are positioned on.
+
+		Args:
+			screen (QScreen): The new primary screen
+		"""
+		if self._screen is not None:
+			try:
+				self._screen.geometryChanged.disconnect(self.update_screen_geometry)
+			except (TypeError, RuntimeError):
+				pass # Old screen already gone
+
+		self._screen = screen
+		screen.geometryChanged.connect(self.update_screen_geometry)
+		self.update_screen_geometry(screen.geometry())
+
+	def update_screen_geometry(self, geometry):
+		"""
+		Cache the screen size used to position notifications.
+
+		Args:
+			geometry (QRect): The screen's geometry
+		"""
+		self._scr_w = geometry.width()
+		self._scr_h = geometry.height()
+
 	def update_size(self, text):
 		"""
 		Calculate and set the widget size based on the text content.
@@ -100,10 +149,11 @@ class VolumeDisplay(QWidget):
 			text (str): The text to be displayed in the notification
 		"""
 		# Calculate required width based on text
-		metrics = QFontMetrics(self.label.font())
-		text_width = metrics.horizontalAdvance(text)
-
-		width = text_width + 20 # Padding + Something seems to be off
+		width = self._width_cache.get(text)
+		if width is None:
+			width = self._metrics.horizontalAdvance(text) + 20 # Padding + Something seems to be off
+			if len(self._width_cache) < WIDTH_CACHE_SIZE:
+				self._width_cache[text] = width
 		height = 40
 
 		# Update sizes
@@ -119,13 +169,16 @@ class VolumeDisplay(QWidget):
 			text (str): The text to display in the notification
 			
 		Thread Safety:
-			Uses a lock to ensure thread-safe timer manipulation
+			Must run on the GUI thread, which owns the hide timer. Other threads reach it
+			through a signal connection, which Qt queues onto the GUI thread.
 			
 		Notes:
 			- Positions itself 20px from the right and 80px from the bottom of the screen
 			- Right-aligns the text within the notification
 			- Automatically resizes based on text content
 		"""
+		assert QThread.currentThread() is self.thread(), "show_notification called off the GUI thread"
+
 		try:
 			# Update text (right-aligned)
 			self.label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
@@ -134,18 +187,17 @@ class VolumeDisplay(QWidget):
 			self.update_size(text)
 
 			# Position window in bottom right
-			screen = QApplication.primaryScreen().geometry()
 			self.move(
-				screen.width() - self.width() - 20,
-				screen.height() - self.height() - 80
+				self._scr_w - self.width() - 20,
+				self._scr_h - self.height() - 80
 			)
 
 			self.show()
 
 			# Reset and start timer
-			with self.timer_lock:
-				self.hide_timer.stop()
-				self.hide_timer.start(1500)
+			self.hide_timer.stop()
+			self.hide_timer.start(1500)
 
 		except Exception as e:
-			logger.error(f"Error showing notification: {str(e)}")
+			if ENABLE_LOGGING:
+				logger.error(f"Error showing notification: {str(e)}")